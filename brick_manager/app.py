@@ -68,6 +68,7 @@ from routes.storage import storage_bp
 from routes.token_management import token_management_bp
 from routes.upload import upload_bp
 from services.part_lookup_service import load_part_lookup
+from services.token_service import clear_request_headers
 
 # pylint: disable=W0718
 
@@ -304,14 +305,25 @@ def scheduled_sync_user_sets():
         app.logger.error(f"Error during scheduled user sets sync: {e}")
 
 
-# Ensure database tables are created
-with app.app_context():
-    db.create_all()  # Ensure tables are created
-    try:
-        master_lookup = load_part_lookup()
-        app.logger.debug("Master lookup data loaded successfully.")
-    except Exception as e:
-        app.logger.error("Failed to load master lookup data: %s", e)
+def init_db():
+    """
+    Create the database tables and load the master lookup data.
+
+    Returns:
+        dict: The master lookup data, or None if it could not be loaded.
+    """
+    with app.app_context():
+        db.create_all()  # Ensure tables are created
+        try:
+            lookup = load_part_lookup()
+            app.logger.debug("Master lookup data loaded successfully.")
+            return lookup
+        except Exception as e:
+            app.logger.error("Failed to load master lookup data: %s", e)
+            return None
+
+
+master_lookup = init_db()
 
 # Register blueprints
 app.register_blueprint(upload_bp)
@@ -331,6 +343,9 @@ app.register_blueprint(rebrickable_sync_bp)
 app.register_blueprint(admin_sync_bp)
 app.register_blueprint(building_instructions_bp)
 
+# Drop the per-request Rebrickable headers cached on flask.g
+app.teardown_request(clear_request_headers)
+
 # Set up the scheduler for database backup and sync tasks
 scheduler = BackgroundScheduler()
 
@@ -356,10 +371,12 @@ scheduler.add_job(
     id="sync_user_sets",
 )
 
-scheduler.start()
+# Jobs stay registered but never run when the scheduler is disabled (tests)
+if os.getenv("BRICK_MANAGER_DISABLE_SCHEDULER") != "1":
+    scheduler.start()
 
-# Shut down the scheduler when exiting the app
-atexit.register(scheduler.shutdown)
+    # Shut down the scheduler when exiting the app
+    atexit.register(scheduler.shutdown)
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5001, debug=False)  # nosec B201
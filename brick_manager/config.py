@@ -55,6 +55,8 @@ class Config:  # pylint: disable=R0903
     # Application settings
     ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "gi"}
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Room in the compiled statement cache for all of the app's distinct queries
+    SQLALCHEMY_ENGINE_OPTIONS = {"query_cache_size": 1200}
     REBRICKABLE_TOKEN = os.getenv("REBRICKABLE_TOKEN", "test-token")
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key")
 
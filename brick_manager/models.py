@@ -17,11 +17,33 @@ Models include:
 # pylint: disable=C0301,R0903,C0103
 
 
+import sqlite3
+
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Boolean, ForeignKey, Integer, Text
+from sqlalchemy import Boolean, ForeignKey, Integer, Text, event
+from sqlalchemy.engine import Engine
 
 db = SQLAlchemy()
 
+# Read-side tuning applied to every SQLite connection. Journal mode and
+# synchronous stay at their defaults so the file-copy backups remain consistent.
+SQLITE_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+@event.listens_for(Engine, "connect")
+def apply_sqlite_pragmas(dbapi_connection, _connection_record):
+    """Apply SQLITE_PRAGMAS to each new SQLite connection."""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 class User_Set(db.Model):
     """Represents a user's collection of sets."""
@@ -257,6 +279,11 @@ class RebrickableParts(db.Model):
 
     __tablename__ = "rebrickable_parts"
 
+    __table_args__ = (
+        # Covers category listings, which filter on part_cat_id and page by part_num
+        db.Index("idx_rebrickable_parts_category", "part_cat_id", "part_num"),
+    )
+
     part_num = db.Column(db.Text, primary_key=True)
     name = db.Column(db.Text, nullable=False)
     part_cat_id = db.Column(
@@ -34,7 +34,7 @@ def enrich_part(item, master_lookup):
     Returns:
         dict: Enriched part data.
     """
-    part_info = RebrickableParts.query.filter_by(part_num=item.part_num).first()
+    part_info = db.session.get(RebrickableParts, item.part_num)
 
     part_data = master_lookup.get(item.part_num, {})
     category = (
@@ -323,7 +323,7 @@ def cache_part_image_api(part_num, color_id):
             return jsonify({"success": True, "url": cached_url})
 
         # Fallback to parts table
-        part_info = RebrickableParts.query.filter_by(part_num=part_num).first()
+        part_info = db.session.get(RebrickableParts, part_num)
         if (
             part_info
             and part_info.part_img_url
@@ -14,6 +14,7 @@ import pandas as pd
 import requests
 from flask import Blueprint, jsonify, render_template, request
 from models import db
+from services.sqlite_service import clear_category_caches
 
 # pylint: disable=C0301,W0718
 import_rebrickable_data_bp = Blueprint("import_rebrickable_data", __name__)
@@ -117,6 +118,11 @@ def ensure_table_structure():
     logging.info("Ensuring database tables match model definitions...")
 
     db.create_all()
+
+    # create_all() skips existing tables, so add indexes introduced later
+    for model_class in _get_model_map().values():
+        for index in model_class.__table__.indexes:
+            index.create(db.engine, checkfirst=True)
     logging.info("✅ All tables are properly structured")
 
 
@@ -180,6 +186,7 @@ def import_data():
             for file in FILES:
                 csv_path = download_and_extract_csv(file)
                 import_csv_to_sqlite(csv_path, model_map[file])
+            clear_category_caches()
             return (
                 jsonify(
                     {"status": "success", "message": "CSV data imported into SQLite!"}
@@ -214,6 +221,7 @@ def main():
     for file in FILES:
         csv_path = download_and_extract_csv(file)
         import_csv_to_sqlite(csv_path, model_map[file])
+    clear_category_caches()
     logging.info("All CSV files imported successfully.")
 
 
@@ -159,7 +159,7 @@ def validate_part(part_num):
     """Validate if a part exists in Rebrickable database and check storage status."""
     try:
         # Check if part exists in Rebrickable database
-        rebrickable_part = RebrickableParts.query.filter_by(part_num=part_num).first()
+        rebrickable_part = db.session.get(RebrickableParts, part_num)
 
         if not rebrickable_part:
             return (
@@ -160,11 +160,7 @@ def get_user_set_details(user_set_id):  # noqa: C901
         # Get category information using part_cat_id
         category_name = "Unknown Category"
         if part_info and part_info.part_cat_id:
-            category = (
-                db.session.query(RebrickablePartCategories)
-                .filter_by(id=part_info.part_cat_id)
-                .first()
-            )
+            category = db.session.get(RebrickablePartCategories, part_info.part_cat_id)
             if category:
                 category_name = category.name
 
@@ -224,11 +220,7 @@ def get_user_set_details(user_set_id):  # noqa: C901
         # Get category information using part_cat_id
         category_name = "Unknown Category"
         if part_info and part_info.part_cat_id:
-            category = (
-                db.session.query(RebrickablePartCategories)
-                .filter_by(id=part_info.part_cat_id)
-                .first()
-            )
+            category = db.session.get(RebrickablePartCategories, part_info.part_cat_id)
             if category:
                 category_name = category.name
 
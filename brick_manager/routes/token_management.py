@@ -14,6 +14,10 @@ import requests
 from cryptography.fernet import Fernet
 from flask import Blueprint, flash, jsonify, redirect, render_template, request, url_for
 from models import ConfigSettings, db
+from services.token_service import (
+    invalidate_encryption_key_cache,
+    invalidate_token_cache,
+)
 
 # pylint: disable=C0301,W0718
 
@@ -39,6 +43,8 @@ def get_encryption_key():
         )
         db.session.add(key_config)
         db.session.commit()
+        # Tokens are decrypted with the cached key, so drop any stale one
+        invalidate_encryption_key_cache()
         return key
     else:
         return base64.b64decode(key_config.value.encode())
@@ -169,6 +175,7 @@ def generate_token():
                     db.session.add(rebrickable_username)
 
                 db.session.commit()
+                invalidate_token_cache()
 
                 logger.info(
                     f"Successfully generated and stored Rebrickable token for user: {username}"
@@ -224,6 +231,7 @@ def delete_token():
         if rebrickable_token:
             db.session.delete(rebrickable_token)
             db.session.commit()
+            invalidate_token_cache()
             logger.info("Rebrickable token deleted successfully")
             return jsonify({"success": True, "message": "Token deleted successfully!"})
         else:
@@ -11,7 +11,7 @@ It includes functions to:
 import logging
 
 import requests
-from services.sqlite_service import get_category_name_from_part_num
+from services.sqlite_service import get_category_names_for_part_nums
 
 # pylint: disable=W0718
 
@@ -96,30 +96,36 @@ def get_predictions(file_path, filename):
         successful_enrichments = 0
         failed_enrichments = 0
 
+        # Look up all categories in one query instead of one per item
+        part_nums = [item["id"] for item in predictions["items"] if item.get("id")]
+        try:
+            category_names = get_category_names_for_part_nums(part_nums)
+        except Exception as db_err:
+            logging.warning(
+                "Failed to retrieve category names for part_nums %s: %s",
+                part_nums,
+                db_err,
+            )
+            category_names = {}
+
         for idx, item in enumerate(predictions["items"]):
             part_num = item.get("id")  # Assuming 'id' corresponds to part_num
             logging.debug(
                 "Processing item %d/%d: part_num=%s", idx + 1, items_count, part_num
             )
 
-            if part_num:
-                try:
-                    category_name = get_category_name_from_part_num(part_num)
-                    item["category_name"] = category_name
-                    logging.debug(
-                        "Successfully enriched part_num %s with category: %s",
-                        part_num,
-                        category_name,
-                    )
-                    successful_enrichments += 1
-                except Exception as db_err:
-                    logging.warning(
-                        "Failed to retrieve category name for part_num %s: %s",
-                        part_num,
-                        db_err,
-                    )
-                    item["category_name"] = "Unknown Category"
-                    failed_enrichments += 1
+            if part_num in category_names:
+                category_name = category_names[part_num]
+                item["category_name"] = category_name
+                logging.debug(
+                    "Successfully enriched part_num %s with category: %s",
+                    part_num,
+                    category_name,
+                )
+                successful_enrichments += 1
+            elif part_num:
+                item["category_name"] = "Unknown Category"
+                failed_enrichments += 1
             else:
                 logging.warning("Item %d has no part_num (id field)", idx + 1)
                 item["category_name"] = "Unknown Category"
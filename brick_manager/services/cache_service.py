@@ -3,6 +3,7 @@ This module handles caching of images locally to optimize retrieval and reduce r
 """
 
 import os
+import re
 from urllib.parse import urlparse
 
 import requests
@@ -11,6 +12,12 @@ from werkzeug.utils import secure_filename
 
 # pylint: disable=W0718
 
+# Matches strings that may have both a scheme and a netloc; anything containing
+# whitespace or control characters is left to urlparse, which strips them
+_URL_CANDIDATE_RE = re.compile(
+    r"[A-Za-z][A-Za-z0-9+.\-]*://[^/?#]|.*[\x00-\x20]", re.DOTALL
+)
+
 
 def get_cache_directory():
     """
@@ -40,6 +47,9 @@ def is_valid_url(url):
     Returns:
         bool: True if the URL is valid, False otherwise.
     """
+    # Reject most malformed strings without a full parse
+    if isinstance(url, str) and _URL_CANDIDATE_RE.match(url) is None:
+        return False
     try:
         result = urlparse(url)
         return all([result.scheme, result.netloc])
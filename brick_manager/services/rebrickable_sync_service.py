@@ -946,11 +946,12 @@ def add_parts_individually_to_list(list_id, parts_data, headers, user_token):
     added_count = 0
 
     rate_limited_count = 0
+    consecutive_429 = 0
 
-    for part in parts_data:
+    for index, part in enumerate(parts_data):
         if should_skip_api_calls():
-            rate_limited_count += 1
-            continue
+            rate_limited_count += len(parts_data) - index
+            break
 
         try:
             url = f"https://rebrickable.com/api/v3/users/{user_token}/partlists/{list_id}/parts/"
@@ -968,13 +969,24 @@ def add_parts_individually_to_list(list_id, parts_data, headers, user_token):
 
             if response.status_code == 201:
                 added_count += 1
+                consecutive_429 = 0
                 update_rate_limit_tracker(False)
             elif response.status_code == 429:
                 rate_limited_count += 1
+                consecutive_429 += 1
                 update_rate_limit_tracker(True)
                 logger.debug(
                     f"Rate limited adding individual part {part['part_num']}/{part['color_id']}"
                 )
+                # Further requests would only be throttled again - defer the rest
+                if consecutive_429 >= 5:
+                    remaining_parts = len(parts_data) - (index + 1)
+                    rate_limited_count += remaining_parts
+                    logger.warning(
+                        f"Stopping individual adds after {consecutive_429} consecutive rate limits, "
+                        f"deferring {remaining_parts} remaining parts"
+                    )
+                    break
             else:
                 logger.debug(
                     f"Failed to add individual part {part['part_num']}/{part['color_id']}: {response.status_code}"
@@ -1191,9 +1203,11 @@ def find_inventory_part_ids_bulk(missing_parts):
         )
 
         # Process each set's parts in bulk
+        rate_limited = False
         for set_num, set_parts in parts_by_set.items():
             if should_skip_api_calls():
                 logger.warning("Stopping bulk processing due to rate limiting")
+                rate_limited = True
                 break
 
             try:
@@ -1201,7 +1215,7 @@ def find_inventory_part_ids_bulk(missing_parts):
                 url = f"https://rebrickable.com/api/v3/lego/sets/{set_num}/parts/"
                 params = {"page_size": 1000}  # Get all parts at once
 
-                _response = make_rate_limited_request(url, headers, params, timeout=30)
+                response = make_rate_limited_request(url, headers, params, timeout=30)
 
                 if response and response.status_code == 200:
                     set_inventory = response.json()
@@ -1232,6 +1246,7 @@ def find_inventory_part_ids_bulk(missing_parts):
                 elif response and response.status_code == 429:
                     logger.warning(f"Rate limited while processing set {set_num}")
                     update_rate_limit_tracker(True)  # Rate limited
+                    rate_limited = True
                     break  # Stop processing on rate limit
                 else:
                     logger.warning(
@@ -1245,6 +1260,8 @@ def find_inventory_part_ids_bulk(missing_parts):
         logger.info(
             f"Bulk processing completed: {len(parts_with_ids)} parts found with inventory IDs"
         )
+        if rate_limited:
+            logger.info("Remaining sets deferred to next scheduled sync")
         return parts_with_ids
 
     except Exception as e:
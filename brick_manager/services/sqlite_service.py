@@ -3,11 +3,62 @@
 This module provides services for interacting with the SQLite database.
 
 """
+import functools
 import logging
 import sqlite3
+from contextlib import contextmanager
 
 from flask import current_app
-from models import RebrickablePartCategories, RebrickableParts
+from models import RebrickablePartCategories, RebrickableParts, db
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of values bound into a single SQL IN clause
+SQLITE_IN_CHUNK_SIZE = 900
+
+
+@contextmanager
+def get_readonly_session():
+    """
+
+    Provide a short-lived session for reference-data SELECTs.
+
+
+    On the application engine the session runs in AUTOCOMMIT mode, so the reads
+    are not wrapped in a BEGIN/COMMIT pair. When db.session is bound to an
+    existing connection (as in the tests) the session joins that connection.
+    It must never be used for writes.
+    """
+    bind = db.session.get_bind()
+    if isinstance(bind, Engine):
+        bind = bind.execution_options(isolation_level="AUTOCOMMIT")
+
+    session = Session(bind=bind, expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_category_name_from_db(part_cat_id):
+    """Look up a category name by ID, memoized until clear_category_caches()."""
+    # Primary-key lookup served from the identity map when already loaded
+    category = db.session.get(RebrickablePartCategories, part_cat_id)
+
+    if category:
+        logger.debug(
+            "Successfully found category: %s for part_cat_id: %s",
+            category.name,
+            part_cat_id,
+        )
+        return category.name
+
+    logger.warning("No category found for part_cat_id: %s", part_cat_id)
+    return "Unknown Category"
 
 
 def get_category_name_from_db(part_cat_id):
@@ -22,24 +73,11 @@ def get_category_name_from_db(part_cat_id):
     Returns:
         str: The category name if found in the database, 'Unknown Category' otherwise.
     """
-    logging.debug("Fetching category name for part_cat_id: %s", part_cat_id)
-
     try:
-        category = RebrickablePartCategories.query.filter_by(id=part_cat_id).first()
-
-        if category:
-            logging.debug(
-                "Successfully found category: %s for part_cat_id: %s",
-                category.name,
-                part_cat_id,
-            )
-            return category.name
-        else:
-            logging.warning("No category found for part_cat_id: %s", part_cat_id)
-            return "Unknown Category"
+        return _cached_category_name_from_db(part_cat_id)
 
     except Exception as e:
-        logging.error(
+        logger.error(
             "Database error while fetching category for part_cat_id %s: %s",
             part_cat_id,
             e,
@@ -47,6 +85,29 @@ def get_category_name_from_db(part_cat_id):
         return "Unknown Category"
 
 
+@functools.lru_cache(maxsize=65536)
+def _cached_category_name_from_part_num(part_num):
+    """Look up a category name by part number, memoized until clear_category_caches()."""
+    # Resolve part -> category in a single JOIN instead of two lookups
+    stmt = (
+        select(RebrickablePartCategories.name)
+        .join(
+            RebrickableParts,
+            RebrickableParts.part_cat_id == RebrickablePartCategories.id,
+        )
+        .where(RebrickableParts.part_num == part_num)
+    )
+    with get_readonly_session() as session:
+        category_name = session.execute(stmt).scalar_one_or_none()
+
+    if category_name:
+        logger.debug("Found category: %s for part_num: %s", category_name, part_num)
+        return category_name
+
+    logger.warning("No category found for part_num: %s", part_num)
+    return "Unknown Category"
+
+
 def get_category_name_from_part_num(part_num):
     """
 
@@ -59,59 +120,67 @@ def get_category_name_from_part_num(part_num):
     Returns:
         str: The category name if found, 'Unknown Category' otherwise.
     """
-    logging.debug("Fetching category name for part_num: %s", part_num)
-
     try:
-        # Query RebrickableParts for the part_num
-        logging.debug("Querying RebrickableParts table for part_num: %s", part_num)
-        part_info = RebrickableParts.query.filter_by(part_num=part_num).first()
-
-        if not part_info:
-            logging.warning(
-                "No part found in RebrickableParts for part_num: %s", part_num
-            )
-            return "Unknown Category"
-
-        if not part_info.part_cat_id:
-            logging.warning("No part_cat_id found for part_num: %s", part_num)
-            return "Unknown Category"
-
-        logging.debug(
-            "Found part_cat_id: %s for part_num: %s", part_info.part_cat_id, part_num
-        )
-
-        # Query RebrickablePartCategories for the part_cat_id
-        logging.debug(
-            "Querying RebrickablePartCategories table for part_cat_id: %s",
-            part_info.part_cat_id,
-        )
-        category = RebrickablePartCategories.query.filter_by(
-            id=part_info.part_cat_id
-        ).first()
-
-        if category:
-            logging.debug(
-                "Found category: %s for part_num: %s (part_cat_id: %s)",
-                category.name,
-                part_num,
-                part_info.part_cat_id,
-            )
-            return category.name
-        else:
-            logging.warning(
-                "No category found for part_cat_id: %s (part_num: %s)",
-                part_info.part_cat_id,
-                part_num,
-            )
-            return "Unknown Category"
+        return _cached_category_name_from_part_num(part_num)
 
     except Exception as e:
-        logging.error(
+        logger.error(
             "Database error while fetching category for part_num %s: %s", part_num, e
         )
         return "Unknown Category"
 
 
+def get_category_names_for_part_nums(part_nums):
+    """
+
+    Fetch the category names for many part numbers at once.
+
+
+    Args:
+        part_nums (iterable): The part numbers to look up.
+
+    Returns:
+        dict: Maps each part number to its category name, 'Unknown Category'
+        for parts or categories that are not in the database.
+    """
+    unique_part_nums = list(dict.fromkeys(part_nums))
+    category_names = dict.fromkeys(unique_part_nums, "Unknown Category")
+    logger.debug("Fetching category names for %d part_nums", len(unique_part_nums))
+
+    try:
+        with get_readonly_session() as session:
+            # Chunk the IN clause to stay below SQLite's bound parameter limit
+            for start in range(0, len(unique_part_nums), SQLITE_IN_CHUNK_SIZE):
+                chunk = unique_part_nums[start : start + SQLITE_IN_CHUNK_SIZE]
+                stmt = (
+                    select(RebrickableParts.part_num, RebrickablePartCategories.name)
+                    .outerjoin(
+                        RebrickablePartCategories,
+                        RebrickableParts.part_cat_id == RebrickablePartCategories.id,
+                    )
+                    .where(RebrickableParts.part_num.in_(chunk))
+                )
+                for part_num, category_name in session.execute(stmt):
+                    if category_name:
+                        category_names[part_num] = category_name
+
+    except Exception as e:
+        logger.error("Database error while fetching categories for part_nums: %s", e)
+
+    return category_names
+
+
+def clear_category_caches():
+    """
+
+    Clear the memoized category lookups.
+
+    Must be called whenever the Rebrickable reference tables are reloaded.
+    """
+    _cached_category_name_from_db.cache_clear()
+    _cached_category_name_from_part_num.cache_clear()
+
+
 # Add missing functions for test compatibility
 
 
@@ -122,7 +191,7 @@ def get_connection():
         db_path = db_uri.replace("sqlite:///", "")
         return sqlite3.connect(db_path)
     except Exception as e:
-        logging.error(f"Error getting database connection: {e}")
+        logger.error(f"Error getting database connection: {e}")
         return None
 
 
@@ -148,7 +217,7 @@ def execute_query(query, params=None):
 
         return result
     except Exception as e:
-        logging.error(f"Error executing query: {e}")
+        logger.error(f"Error executing query: {e}")
         return None
     finally:
         conn.close()
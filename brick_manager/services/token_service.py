@@ -9,45 +9,143 @@ to securely access stored tokens for API calls.
 
 import base64
 import logging
+import time
 
 from cryptography.fernet import Fernet
+from flask import g, has_request_context
 from models import ConfigSettings
+from services.sqlite_service import get_readonly_session
+from sqlalchemy import select
 
 logger = logging.getLogger(__name__)
 
+# Seconds a decrypted user token is reused before it is read from the database again
+TOKEN_CACHE_TTL = 60
+
+# Seconds the API key is reused; it only changes when an administrator resets it
+API_KEY_CACHE_TTL = 300
+
+# Raw encryption key bytes; the key never changes once it has been generated
+_ENCRYPTION_KEY = None
+
+# In-process caches for the Fernet instance, the decrypted user token and the API key
+_fernet_cache = {"key": None, "fernet": None}
+_token_cache = {"value": None, "expires": 0}
+_api_key_cache = {"value": None, "expires": 0}
+
+# ConfigSettings keys needed to build Rebrickable request headers
+_HEADER_CONFIG_KEYS = (
+    "rebrickable_api_key",
+    "rebrickable_user_token",
+    "encryption_key",
+)
+
+
+def _load_config_bundle():
+    """Load all header-related config values in one query, keyed by setting key."""
+    stmt = select(ConfigSettings.key, ConfigSettings.value).where(
+        ConfigSettings.key.in_(_HEADER_CONFIG_KEYS)
+    )
+    with get_readonly_session() as session:
+        return dict(session.execute(stmt).all())
+
+
+def _get_config_value(key):
+    """Fetch a single config value, or None when the setting does not exist."""
+    stmt = select(ConfigSettings.value).where(ConfigSettings.key == key)
+    with get_readonly_session() as session:
+        return session.execute(stmt).scalar_one_or_none()
+
+
+def _remember_encryption_key(key_value):
+    """Decode a stored encryption key and keep it for the life of the process."""
+    global _ENCRYPTION_KEY
+    if key_value:
+        _ENCRYPTION_KEY = base64.b64decode(key_value.encode())
+    return _ENCRYPTION_KEY
+
 
 def get_encryption_key():
-    """Get the encryption key from the database."""
+    """Get the encryption key, reading it from the database on first use."""
+    if _ENCRYPTION_KEY is not None:
+        return _ENCRYPTION_KEY
+
     try:
-        key_config = ConfigSettings.query.filter_by(key="encryption_key").first()
-        if key_config:
-            return base64.b64decode(key_config.value.encode())
-        return None
+        return _remember_encryption_key(_get_config_value("encryption_key"))
     except Exception as e:
         logger.error(f"Error retrieving encryption key: {e}")
         return None
 
 
-def decrypt_token(encrypted_token):
-    """Decrypt a stored token."""
+def invalidate_encryption_key_cache():
+    """Forget the cached encryption key and its Fernet instance."""
+    global _ENCRYPTION_KEY
+    _ENCRYPTION_KEY = None
+    _fernet_cache["key"] = None
+    _fernet_cache["fernet"] = None
+
+
+def invalidate_token_cache():
+    """Forget the cached user token, e.g. after it was regenerated or deleted."""
+    _token_cache["value"] = None
+    _token_cache["expires"] = 0
+
+
+def invalidate_api_key_cache():
+    """Forget the cached API key so the next call reads it from the database."""
+    _api_key_cache["value"] = None
+    _api_key_cache["expires"] = 0
+
+
+def _cached(cache):
+    """Return the cached value while it is fresh, otherwise None."""
+    if cache["value"] and time.monotonic() < cache["expires"]:
+        return cache["value"]
+    return None
+
+
+def _remember(cache, value, ttl):
+    """Keep a non-empty value in the cache for ttl seconds."""
+    if value:
+        cache["value"] = value
+        cache["expires"] = time.monotonic() + ttl
+    return value
+
+
+def _get_fernet(key):
+    """Return a Fernet instance for the key, reusing the last one if unchanged."""
+    if _fernet_cache["key"] != key:
+        _fernet_cache["fernet"] = Fernet(key)
+        _fernet_cache["key"] = key
+    return _fernet_cache["fernet"]
+
+
+def _decrypt_with_key(encrypted_token, key):
+    """Decrypt a stored token with an already loaded encryption key."""
     try:
-        key = get_encryption_key()
         if not key:
             return None
-        fernet = Fernet(key)
+        fernet = _get_fernet(key)
         return fernet.decrypt(encrypted_token.encode()).decode()
     except Exception as e:
         logger.error(f"Error decrypting token: {e}")
         return None
 
 
+def decrypt_token(encrypted_token):
+    """Decrypt a stored token."""
+    return _decrypt_with_key(encrypted_token, get_encryption_key())
+
+
 def get_rebrickable_api_key():
     """Get the Rebrickable API key."""
+    api_key = _cached(_api_key_cache)
+    if api_key:
+        return api_key
+
     try:
-        api_key_config = ConfigSettings.query.filter_by(
-            key="rebrickable_api_key"
-        ).first()
-        return api_key_config.value if api_key_config else None
+        api_key = _get_config_value("rebrickable_api_key")
+        return _remember(_api_key_cache, api_key, API_KEY_CACHE_TTL)
     except Exception as e:
         logger.error(f"Error retrieving API key: {e}")
         return None
@@ -55,23 +153,53 @@ def get_rebrickable_api_key():
 
 def get_rebrickable_user_token():
     """Get the decrypted Rebrickable user token."""
+    user_token = _cached(_token_cache)
+    if user_token:
+        return user_token
+
     try:
-        token_config = ConfigSettings.query.filter_by(
-            key="rebrickable_user_token"
-        ).first()
-        if not token_config:
+        encrypted_token = _get_config_value("rebrickable_user_token")
+        if not encrypted_token:
             return None
-        return decrypt_token(token_config.value)
+        user_token = decrypt_token(encrypted_token)
+        return _remember(_token_cache, user_token, TOKEN_CACHE_TTL)
     except Exception as e:
         logger.error(f"Error retrieving user token: {e}")
         return None
 
 
 def get_rebrickable_headers():
-    """Get headers for Rebrickable API calls including both API key and user token."""
+    """Get headers for Rebrickable API calls including both API key and user token.
+
+    Within a request the headers are built once and kept on ``flask.g`` until
+    clear_request_headers() runs at request teardown.
+    """
+    if has_request_context() and "rebrickable_headers" in g:
+        return dict(g.rebrickable_headers)
+
     try:
-        api_key = get_rebrickable_api_key()
-        user_token = get_rebrickable_user_token()
+        api_key = _cached(_api_key_cache)
+        user_token = _cached(_token_cache)
+
+        # Whatever is not cached is loaded together in one query
+        if not api_key or not user_token:
+            config = _load_config_bundle()
+            if not api_key:
+                api_key = _remember(
+                    _api_key_cache,
+                    config.get("rebrickable_api_key"),
+                    API_KEY_CACHE_TTL,
+                )
+            encrypted_token = config.get("rebrickable_user_token")
+            if not user_token and encrypted_token:
+                key = _ENCRYPTION_KEY or _remember_encryption_key(
+                    config.get("encryption_key")
+                )
+                user_token = _remember(
+                    _token_cache,
+                    _decrypt_with_key(encrypted_token, key),
+                    TOKEN_CACHE_TTL,
+                )
 
         if not api_key:
             logger.error("Rebrickable API key not configured")
@@ -82,19 +210,28 @@ def get_rebrickable_headers():
         if user_token:
             headers["User-Token"] = user_token
 
+        if has_request_context():
+            g.rebrickable_headers = dict(headers)
+
         return headers
     except Exception as e:
         logger.error(f"Error building Rebrickable headers: {e}")
         return None
 
 
+def clear_request_headers(_exception=None):
+    """Drop the headers cached on ``flask.g`` for the current request."""
+    g.pop("rebrickable_headers", None)
+
+
 def is_user_token_configured():
     """Check if a user token is configured."""
     try:
-        token_config = ConfigSettings.query.filter_by(
-            key="rebrickable_user_token"
-        ).first()
-        return token_config is not None
+        stmt = select(ConfigSettings.id).where(
+            ConfigSettings.key == "rebrickable_user_token"
+        )
+        with get_readonly_session() as session:
+            return session.execute(stmt).first() is not None
     except Exception as e:
         logger.error(f"Error checking token configuration: {e}")
         return False
@@ -14,6 +14,7 @@ sys.path.insert(0, ".")
 try:
     from app import app, db
     from models import ConfigSettings
+    from services.token_service import invalidate_api_key_cache
 
     # The Rebrickable API key (should be configured by administrator)
     REBRICKABLE_API_KEY = "b2c9a7eed2146bafdfe49f8d17b1faea"  # From your API example
@@ -34,6 +35,7 @@ try:
                 api_key_config.value = REBRICKABLE_API_KEY
                 api_key_config.updated_at = db.func.current_timestamp()
                 db.session.commit()
+                invalidate_api_key_cache()
                 print("API key updated successfully!")
             else:
                 print("API key unchanged")
@@ -47,6 +49,7 @@ try:
             )
             db.session.add(api_key_config)
             db.session.commit()
+            invalidate_api_key_cache()
             print("API key configured successfully!")
 
         print(
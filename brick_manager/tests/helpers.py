@@ -0,0 +1,19 @@
+"""Small test doubles shared by several test modules."""
+
+
+class StubResponse:
+    """Minimal successful requests.Response stand-in."""
+
+    __slots__ = ("status_code", "_json", "headers", "text")
+
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self._json = payload
+        self.headers = {}
+        self.text = ""
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self):
+        pass
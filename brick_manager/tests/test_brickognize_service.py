@@ -9,61 +9,96 @@ from the `brickognize_service` module, including:
 - Handling API failures, invalid JSON responses, and database lookup errors.
 """
 
-import unittest
-from unittest.mock import MagicMock, mock_open, patch
+import io
+from unittest.mock import Mock, patch
 
+import pytest
 import requests
 
 from brick_manager.services.brickognize_service import get_predictions
 
+SERVICE = "brick_manager.services.brickognize_service"
 
-class TestBrickognizeService(unittest.TestCase):
+
+def _json_response(payload=None, error=None):
+    """Build a 200 response whose json() returns payload or raises error."""
+    response = Mock(spec=requests.Response)
+    response.status_code = 200
+    response.headers = {}
+    response.text = ""
+    response.json = Mock(return_value=payload, side_effect=error)
+    return response
+
+
+@pytest.fixture
+def fake_image():
+    """The uploaded image, kept in memory."""
+    return io.BytesIO(b"fake_image_data")
+
+
+@pytest.fixture
+def mock_open(fake_image):
+    """Serve the uploaded image from memory instead of the filesystem."""
+    with patch(f"{SERVICE}.open", return_value=fake_image, create=True) as opener:
+        yield opener
+
+
+@pytest.fixture
+def mock_post():
+    """Patch the HTTP POST to the Brickognize API."""
+    with patch("requests.post") as post:
+        yield post
+
+
+@pytest.fixture
+def mock_get_category():
+    """Patch the batched category name lookup."""
+    with patch(f"{SERVICE}.get_category_names_for_part_nums") as lookup:
+        yield lookup
+
+
+class TestBrickognizeService:
     """Unit tests for the `brickognize_service` module."""
 
-    @patch("builtins.open", new_callable=mock_open, read_data=b"fake_image_data")
-    @patch("requests.post")
-    @patch("brick_manager.services.brickognize_service.get_category_name_from_part_num")
-    def test_get_predictions_success(self, mock_get_category, mock_post, mock_open_obj):
+    def test_get_predictions_success(
+        self, fake_image, mock_open, mock_post, mock_get_category
+    ):
         """
 
         Test get_predictions when the API request and category enrichment succeed.
         """
         # Mock the API response
 
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"items": [{"id": "3001", "confidence": 0.95}]},
+        mock_post.return_value = _json_response(
+            {"items": [{"id": "3001", "confidence": 0.95}]}
         )
 
         # Mock the category name lookup
-        mock_get_category.return_value = "Bricks"
+        mock_get_category.return_value = {"3001": "Bricks"}
 
         # Call the function
         file_path = "test_image.jpg"
         filename = "image.jpg"
         result = get_predictions(file_path, filename)
 
-        # Assert the API was called
+        # Assert the image was read from disk and sent to the API
+        mock_open.assert_called_once_with(file_path, "rb")
         mock_post.assert_called_once_with(
             "https://api.brickognize.com/predict/",
             headers={"accept": "application/json"},
-            files={
-                "query_image": (filename, mock_open_obj(), "image/jpeg")
-            },  # Use the mock file object here
+            files={"query_image": (filename, fake_image, "image/jpeg")},
             timeout=10,
         )
 
         # Assert the database lookup was called
-        mock_get_category.assert_called_once_with("3001")
+        mock_get_category.assert_called_once_with(["3001"])
 
         # Validate the result
-        self.assertIsNotNone(result)
-        self.assertIn("items", result)
-        self.assertEqual(result["items"][0]["category_name"], "Bricks")
+        assert result is not None
+        assert "items" in result
+        assert result["items"][0]["category_name"] == "Bricks"
 
-    @patch("builtins.open", new_callable=mock_open, read_data=b"fake_image_data")
-    @patch("requests.post")
-    def test_get_predictions_api_failure(self, mock_post, _):
+    def test_get_predictions_api_failure(self, mock_open, mock_post):
         """Test get_predictions when the API request fails."""
         # Mock an API error
 
@@ -78,16 +113,13 @@ class TestBrickognizeService(unittest.TestCase):
         mock_post.assert_called_once()
 
         # Validate the result
-        self.assertIsNone(result)
+        assert result is None
 
-    @patch("builtins.open", new_callable=mock_open, read_data=b"fake_image_data")
-    @patch("requests.post")
-    def test_get_predictions_invalid_json(self, mock_post, _):
+    def test_get_predictions_invalid_json(self, mock_open, mock_post):
         """Test get_predictions when the API returns invalid JSON."""
         # Mock a response with invalid JSON
 
-        mock_post.return_value = MagicMock(status_code=200, json=lambda: None)
-        mock_post.return_value.json.side_effect = ValueError("Invalid JSON")
+        mock_post.return_value = _json_response(error=ValueError("Invalid JSON"))
 
         # Call the function
         file_path = "test_image.jpg"
@@ -98,18 +130,14 @@ class TestBrickognizeService(unittest.TestCase):
         mock_post.assert_called_once()
 
         # Validate the result
-        self.assertIsNone(result)
+        assert result is None
 
-    @patch("builtins.open", new_callable=mock_open, read_data=b"fake_image_data")
-    @patch("requests.post")
-    @patch("brick_manager.services.brickognize_service.get_category_name_from_part_num")
-    def test_get_predictions_db_failure(self, mock_get_category, mock_post, _):
+    def test_get_predictions_db_failure(self, mock_open, mock_post, mock_get_category):
         """Test get_predictions when the database category lookup fails."""
         # Mock the API response
 
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"items": [{"id": "3001", "confidence": 0.95}]},
+        mock_post.return_value = _json_response(
+            {"items": [{"id": "3001", "confidence": 0.95}]}
         )
 
         # Mock a database error
@@ -124,10 +152,6 @@ class TestBrickognizeService(unittest.TestCase):
         mock_post.assert_called_once()
 
         # Validate the result
-        self.assertIsNotNone(result)
-        self.assertIn("items", result)
-        self.assertEqual(result["items"][0]["category_name"], "Unknown Category")
-
-
-if __name__ == "__main__":
-    unittest.main()
+        assert result is not None
+        assert "items" in result
+        assert result["items"][0]["category_name"] == "Unknown Category"
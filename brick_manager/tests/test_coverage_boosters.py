@@ -5,301 +5,196 @@ High-impact focused tests to boost coverage from 19.52% to 21%+.
 Target easily tested functions with high statement coverage.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
 
+import manage
 import pytest
+from config import Config
+from models import (
+    RebrickableColors,
+    RebrickablePartCategories,
+    RebrickableParts,
+    RebrickableSets,
+)
+from services.cache_service import is_valid_url
+from services.part_lookup_service import load_part_lookup
+from services.rebrickable_service import RebrickableService
+
+VALID_URLS = (
+    "https://example.com/image.jpg",
+    "http://test.com/file.png",
+    "https://cdn.rebrickable.com/media/parts/elements/123.jpg",
+)
+
+INVALID_URLS = ("", "not-a-url", "http://", "https://", None, 123, [])
+
+
+@pytest.fixture(scope="module")
+def rebrickable_headers():
+    """Rebrickable API headers, built once with a known token."""
+    with patch("services.rebrickable_service.Config") as mock_config:
+        mock_config.REBRICKABLE_TOKEN = "test_token"
+        return RebrickableService._get_headers()
+
+
+@pytest.fixture
+def mock_part_lookup_db():
+    """Patch the part lookup service's db with an empty query result."""
+    with patch("services.part_lookup_service.db") as mock_db:
+        mock_db.session.query.return_value.all.return_value = []
+        yield mock_db
 
 
 class TestCoverageBoosters:
     """Tests targeting high-impact coverage improvements."""
 
     @pytest.mark.unit
-    @patch("app.shutil.copyfile")
-    @patch("app.datetime")
-    @patch("app.app")
-    def test_backup_database_comprehensive(
-        self, mock_app, mock_datetime, mock_copyfile
-    ):
+    def test_backup_database_comprehensive(self):
         """Test backup database with comprehensive coverage."""
 
         from app import backup_database
 
-        # Test successful backup
-        mock_datetime.now.return_value.strftime.return_value = "20241017_120000"
-        mock_app.config = {"SQLALCHEMY_DATABASE_URI": "sqlite:///test.db"}
-        mock_app.logger = MagicMock()
+        with patch.multiple(
+            "app", shutil=DEFAULT, datetime=DEFAULT, app=DEFAULT
+        ) as mocks:
+            mock_copyfile = mocks["shutil"].copyfile
+            mock_app = mocks["app"]
+
+            # Test successful backup
+            mocks["datetime"].now.return_value.strftime.return_value = "20241017_120000"
+            mock_app.config = {"SQLALCHEMY_DATABASE_URI": "sqlite:///test.db"}
+            mock_app.logger = MagicMock()
 
-        backup_database()
+            backup_database()
 
-        mock_copyfile.assert_called_once()
-        mock_app.logger.info.assert_called()
+            mock_copyfile.assert_called_once()
+            mock_app.logger.info.assert_called()
 
-        # Test backup failure
-        mock_copyfile.side_effect = Exception("Backup failed")
-        mock_app.logger.reset_mock()
+            # Test backup failure
+            mock_copyfile.side_effect = Exception("Backup failed")
+            mock_app.logger.reset_mock()
 
-        backup_database()
+            backup_database()
 
-        mock_app.logger.error.assert_called()
+            mock_app.logger.error.assert_called()
 
     @pytest.mark.unit
     def test_config_comprehensive(self):
         """Test config module comprehensively."""
-        try:
-            from config import Config
-
-            # Test config class exists and has expected attributes
-            assert hasattr(Config, "__dict__")
-            config_instance = Config()
-            assert config_instance is not None
 
-            # Test that we can access config properties
-            assert hasattr(Config, "__module__")
+        # Test config class exists and has expected attributes
+        assert hasattr(Config, "__dict__")
+        config_instance = Config()
+        assert config_instance is not None
 
-        except ImportError:
-            pytest.fail("Could not import Config")
+        # Test that we can access config properties
+        assert hasattr(Config, "__module__")
 
     @pytest.mark.unit
-    def test_manage_module_comprehensive(self):
-        """Test manage module functions."""
-        try:
-            import manage
-
-            assert manage is not None
-
-            # Test that manage module can be imported without errors
-            assert hasattr(manage, "__file__")
-
-        except ImportError:
-            pytest.fail("Could not import manage module")
-
-    @pytest.mark.unit
-    def test_services_init_comprehensive(self):
-        """Test services __init__ module."""
-        try:
-            import services
-
-            assert services is not None
-
-            # Test services package initialization
-            assert hasattr(services, "__path__")
+    def test_manage_wires_migrate_to_app(self, flask_app):
+        """Test the manage script wires migrations to the production app."""
 
-        except ImportError:
-            pytest.fail("Could not import services package")
+        assert manage.app is flask_app
+        assert manage.migrate.db is manage.db
 
     @pytest.mark.unit
-    def test_routes_init_comprehensive(self):
-        """Test routes __init__ module."""
-        try:
-            import routes
-
-            assert routes is not None
-
-            # Test routes package initialization
-            assert hasattr(routes, "__path__")
-
-        except ImportError:
-            pytest.fail("Could not import routes package")
+    @pytest.mark.parametrize("url", VALID_URLS)
+    @patch("services.cache_service.current_app")
+    def test_cache_service_is_valid_url_comprehensive(self, mock_app, url):
+        """Test cache service URL validation accepts well-formed URLs."""
+        assert is_valid_url(url) is True
 
     @pytest.mark.unit
+    @pytest.mark.parametrize("url", INVALID_URLS)
     @patch("services.cache_service.current_app")
-    def test_cache_service_is_valid_url_comprehensive(self, mock_app):
-        """Test cache service URL validation comprehensively."""
-
-        from services.cache_service import is_valid_url
-
-        # Test valid URLs
-        valid_urls = [
-            "https://example.com/image.jpg",
-            "http://test.com/file.png",
-            "https://cdn.rebrickable.com/media/parts/elements/123.jpg",
-        ]
-
-        for url in valid_urls:
-            assert is_valid_url(url) is True
-
-        # Test invalid URLs
-        invalid_urls = ["", "not-a-url", "http://", "https://", None, 123, []]
-
-        for url in invalid_urls:
-            try:
-                result = is_valid_url(url)
-                assert result is False
-            except Exception:
-                # Some invalid inputs might raise exceptions, which is also valid
-                pass
+    def test_cache_service_rejects_invalid_urls(self, mock_app, url):
+        """Test cache service URL validation rejects malformed input."""
+        try:
+            result = is_valid_url(url)
+        except (AttributeError, TypeError):
+            # Some invalid inputs might raise exceptions, which is also valid
+            return
+        assert result is False
 
     @pytest.mark.unit
-    @patch("services.rebrickable_service.Config")
-    def test_rebrickable_service_basic_functions(self, mock_config):
+    def test_rebrickable_service_basic_functions(self, rebrickable_headers):
         """Test rebrickable service basic functionality."""
 
-        mock_config.REBRICKABLE_TOKEN = "test_token"
-
-        try:
-            from services.rebrickable_service import RebrickableService
-
-            # Test that the service class can be instantiated
-            service = RebrickableService()
-            assert service is not None
+        # Test that the service class can be instantiated
+        service = RebrickableService()
+        assert service is not None
 
-            # Test private _get_headers method exists
-            assert hasattr(RebrickableService, "_get_headers")
-
-            # Test that we can call _get_headers (for coverage)
-            headers = RebrickableService._get_headers()
-            assert isinstance(headers, dict)
-            assert "Authorization" in headers
-            assert "Accept" in headers
-
-        except ImportError:
-            # Service might not exist
-            pass
+        # Test that _get_headers builds the API headers (for coverage)
+        assert isinstance(rebrickable_headers, dict)
+        assert rebrickable_headers["Authorization"] == "key test_token"
+        assert "Accept" in rebrickable_headers
 
     @pytest.mark.unit
-    def test_part_lookup_service_load_function(self):
+    def test_part_lookup_service_load_function(self, mock_part_lookup_db):
         """Test part lookup service load functionality."""
-        try:
-            from services.part_lookup_service import load_part_lookup
-
-            # Mock database to avoid actual DB calls
-            with patch("services.part_lookup_service.db") as mock_db:
-                mock_query_result = MagicMock()
-                mock_query_result.all.return_value = []
-                mock_db.session.query.return_value = mock_query_result
-
-                result = load_part_lookup()
-                assert isinstance(result, dict)
-
-        except ImportError:
-            pytest.fail("Could not import load_part_lookup")
-
-    @pytest.mark.unit
-    def test_brickognize_service_functions(self):
-        """Test brickognize service basic functions."""
-        try:
-            from services import brickognize_service
-
-            # Test module can be imported
-            assert hasattr(brickognize_service, "__file__")
-
-            # Test basic module attributes
-            assert brickognize_service is not None
-
-        except ImportError:
-            pytest.fail("Could not import brickognize_service")
-
-    @pytest.mark.unit
-    def test_label_service_basic_imports(self):
-        """Test label service basic imports and attributes."""
-        try:
-            from services import label_service
 
-            # Test module import
-            assert label_service is not None
-            assert hasattr(label_service, "__file__")
-
-        except ImportError:
-            pytest.fail("Could not import label_service")
-
-    @pytest.mark.unit
-    def test_token_service_basic_imports(self):
-        """Test token service basic imports."""
-        try:
-            from services import token_service
-
-            # Test module import
-            assert token_service is not None
-            assert hasattr(token_service, "__file__")
-
-        except ImportError:
-            pytest.fail("Could not import token_service")
-
-    @pytest.mark.unit
-    def test_sqlite_service_basic_imports(self):
-        """Test sqlite service basic imports."""
-        try:
-            from services import sqlite_service
-
-            # Test module import
-            assert sqlite_service is not None
-            assert hasattr(sqlite_service, "__file__")
-
-        except ImportError:
-            pytest.fail("Could not import sqlite_service")
+        result = load_part_lookup()
+        assert isinstance(result, dict)
 
     @pytest.mark.unit
     def test_models_comprehensive_coverage(self):
         """Test models with comprehensive coverage of __repr__ methods."""
-        try:
-            from models import (
-                RebrickableColors,
-                RebrickablePartCategories,
-                RebrickableParts,
-                RebrickableSets,
-            )
-
-            # Test that all models can be instantiated
-            models_to_test = [
-                RebrickablePartCategories(),
-                RebrickableColors(),
-                RebrickableParts(),
-                RebrickableSets(),
-            ]
-
-            for model in models_to_test:
-                # Test __repr__ method exists and works
-                repr_str = repr(model)
-                assert isinstance(repr_str, str)
-                assert len(repr_str) > 0
-
-        except ImportError:
-            pytest.fail("Could not import model classes")
+
+        # Each model defines its own __repr__
+        for model_cls in (
+            RebrickablePartCategories,
+            RebrickableColors,
+            RebrickableParts,
+            RebrickableSets,
+        ):
+            assert "__repr__" in vars(model_cls)
+
+        # Exercise the repr path on a spec'd stand-in, skipping ORM instrumentation
+        category = Mock(spec=RebrickablePartCategories)
+        category.name = "Bricks"
+        repr_str = RebrickablePartCategories.__repr__(category)
+        assert repr_str == "<RebrickablePartCategory Bricks>"
 
     @pytest.mark.unit
-    def test_app_error_handling_paths(self):
+    def test_app_error_handling_paths(self, flask_app):
         """Test app error handling code paths."""
-        try:
-            from app import app
-
-            # Test that app object has expected attributes
-            assert hasattr(app, "config")
-            assert hasattr(app, "logger")
 
-            # Test Flask app configuration
-            with app.app_context():
-                assert app.config is not None
+        # Test that app object has expected attributes
+        assert hasattr(flask_app, "config")
+        assert hasattr(flask_app, "logger")
 
-        except ImportError:
-            pytest.fail("Could not import app")
+        # The config lives on the app object; no app context is needed
+        assert flask_app.config is not None
 
     @pytest.mark.unit
-    @patch("services.token_service.get_rebrickable_api_key")
-    @patch("services.token_service.get_rebrickable_user_token")
-    @patch("app.app")
-    def test_scheduled_sync_error_paths(self, mock_app, mock_user_token, mock_api_key):
+    def test_scheduled_sync_error_paths(self):
         """Test scheduled sync error handling paths."""
 
         from app import scheduled_sync_missing_parts, scheduled_sync_user_sets
 
-        mock_app.logger = MagicMock()
+        with patch("app.app") as mock_app, patch.multiple(
+            "services.token_service",
+            get_rebrickable_api_key=DEFAULT,
+            get_rebrickable_user_token=DEFAULT,
+        ) as tokens:
+            mock_app.logger = MagicMock()
 
-        # Test with no tokens
-        mock_user_token.return_value = None
-        mock_api_key.return_value = None
+            # Test with no tokens
+            tokens["get_rebrickable_user_token"].return_value = None
+            tokens["get_rebrickable_api_key"].return_value = None
 
-        scheduled_sync_missing_parts()
-        scheduled_sync_user_sets()
+            scheduled_sync_missing_parts()
+            scheduled_sync_user_sets()
 
-        # Verify logging occurred
-        assert mock_app.logger.info.call_count >= 2
+            # Verify logging occurred
+            assert mock_app.logger.info.call_count >= 2
 
-        # Test with exception in token retrieval
-        mock_user_token.side_effect = Exception("Token error")
-        mock_app.logger.reset_mock()
+            # Test with exception in token retrieval
+            tokens["get_rebrickable_user_token"].side_effect = Exception("Token error")
+            mock_app.logger.reset_mock()
 
-        scheduled_sync_missing_parts()
-        scheduled_sync_user_sets()
+            scheduled_sync_missing_parts()
+            scheduled_sync_user_sets()
 
-        # Verify error logging occurred
-        assert mock_app.logger.error.call_count >= 2
+            # Verify error logging occurred
+            assert mock_app.logger.error.call_count >= 2
@@ -5,316 +5,158 @@ Final coverage push - targeting routes and remaining high-impact areas.
 Focus on simple, working tests that cover the most lines possible.
 """
 
+import importlib
 from unittest.mock import MagicMock, patch
 
 import pytest
+import routes.import_rebrickable_data as import_rebrickable_data
+import services.label_service as label_service
+import services.rebrickable_sets_sync_service as sets_sync_service
+import services.rebrickable_sync_service as sync_service
+import services.sqlite_service as sqlite_service
+from config import Config
+from services.brickognize_service import get_predictions
+from services.cache_service import is_valid_url
+
+# (module, blueprint attribute) of the route modules checked for structure
+ROUTE_BLUEPRINTS = (
+    ("routes.main", "main_bp"),
+    ("routes.dashboard", "dashboard_bp"),
+    ("routes.storage", "storage_bp"),
+    ("routes.upload", "upload_bp"),
+    ("routes.part_lookup", "part_lookup_bp"),
+    ("routes.set_maintain", "set_maintain_bp"),
+    ("routes.set_search", "set_search_bp"),
+    ("routes.missing_parts", "missing_parts_bp"),
+)
+
+# (attribute, type, required value or None) of the settings every environment defines
+CONFIG_ATTRS = (
+    ("UPLOAD_FOLDER", str, None),
+    ("ALLOWED_EXTENSIONS", set, None),
+    ("SQLALCHEMY_DATABASE_URI", str, None),
+    ("SQLALCHEMY_TRACK_MODIFICATIONS", bool, False),
+    ("SECRET_KEY", str, None),
+    ("REBRICKABLE_TOKEN", str, None),
+)
+
+# URL edge cases for cache_service.is_valid_url, with the expected result
+URL_CASES = (
+    ("https://very-long-subdomain.example-domain.com/path/to/resource.jpg", True),
+    ("http://192.168.1.1:8080/image.png", True),
+    ("https://cdn.example.org/nested/deep/path/file.jpg?param=value", True),
+    ("http://example.com/file.jpg#anchor", True),
+    ("https://api.rebrickable.com/api/v3/media/parts/elements/1234.jpg", True),
+    ("", False),
+    ("   ", False),
+    ("http", False),
+    ("://noscheme.com", False),
+    ("localhost:8080/file.jpg", False),
+    ("www.example.com/file.jpg", False),
+)
+
+
+def _has_public_callable(module):
+    """Whether the module defines or imports at least one public callable."""
+    return any(
+        callable(value) and not name.startswith("_")
+        for name, value in vars(module).items()
+    )
 
 
 class TestFinalCoveragePush:
     """Final tests to push coverage over 70% by targeting routes and high-impact modules."""
 
     @pytest.mark.unit
-    def test_routes_main_comprehensive(self):
-        """Test main routes module thoroughly."""
-        try:
-            # Import and test main routes
-            from routes.main import main_bp
+    @pytest.mark.parametrize("module_name,bp_name", ROUTE_BLUEPRINTS)
+    def test_route_blueprint_structure(self, module_name, bp_name):
+        """Test each route module exposes its blueprint."""
 
-            assert main_bp is not None
-            assert hasattr(main_bp, "name")
-            assert main_bp.name == "main"
+        blueprint = getattr(importlib.import_module(module_name), bp_name)
 
-            # Test blueprint properties
-            assert hasattr(main_bp, "url_prefix")
-
-        except ImportError:
-            # Expected in some test environments
-            pass
-
-    @pytest.mark.unit
-    def test_dashboard_route_imports(self):
-        """Test dashboard route imports and basic structure."""
-        try:
-            from routes.dashboard import dashboard_bp
-
-            assert dashboard_bp is not None
-
-            # Test the blueprint
-            assert hasattr(dashboard_bp, "name")
-
-        except ImportError:
-            pass
+        assert blueprint.name == bp_name.removesuffix("_bp")
+        assert hasattr(blueprint, "url_prefix")
 
     @pytest.mark.unit
     def test_import_rebrickable_data_structure(self):
         """Test import rebrickable data route structure."""
-        try:
-            from routes.import_rebrickable_data import import_bp
-
-            assert import_bp is not None
-
-            # Test functions if available
-            import routes.import_rebrickable_data as imp_module
-
-            # Count available functions
-            func_count = 0
-            for attr_name in dir(imp_module):
-                if callable(
-                    getattr(imp_module, attr_name)
-                ) and not attr_name.startswith("_"):
-                    func_count += 1
-
-            assert func_count >= 0  # At least some functions exist
-
-        except ImportError:
-            pass
-
-    @pytest.mark.unit
-    def test_storage_route_structure(self):
-        """Test storage route structure."""
-        try:
-            from routes.storage import storage_bp
-
-            assert storage_bp is not None
-
-            # Test common route attributes
-            assert hasattr(storage_bp, "name")
-
-        except ImportError:
-            pass
-
-    @pytest.mark.unit
-    def test_upload_route_structure(self):
-        """Test upload route structure."""
-        try:
-            from routes.upload import upload_bp
-
-            assert upload_bp is not None
-
-            # Test blueprint attributes
-            assert hasattr(upload_bp, "name")
-
-        except ImportError:
-            pass
-
-    @pytest.mark.unit
-    def test_part_lookup_route_structure(self):
-        """Test part lookup route structure."""
-        try:
-            from routes.part_lookup import part_lookup_bp
-
-            assert part_lookup_bp is not None
-
-        except ImportError:
-            pass
-
-    @pytest.mark.unit
-    def test_set_maintain_route_structure(self):
-        """Test set maintain route structure."""
-        try:
-            from routes.set_maintain import set_maintain_bp
-
-            assert set_maintain_bp is not None
-
-        except ImportError:
-            pass
-
-    @pytest.mark.unit
-    def test_set_search_route_structure(self):
-        """Test set search route structure."""
-        try:
-            from routes.set_search import set_search_bp
 
-            assert set_search_bp is not None
+        assert import_rebrickable_data.import_rebrickable_data_bp is not None
 
-        except ImportError:
-            pass
-
-    @pytest.mark.unit
-    def test_missing_parts_route_structure(self):
-        """Test missing parts route structure."""
-        try:
-            from routes.missing_parts import missing_parts_bp
-
-            assert missing_parts_bp is not None
-
-        except ImportError:
-            pass
+        # At least some public functions exist
+        assert _has_public_callable(import_rebrickable_data)
 
     @pytest.mark.unit
     @patch("services.rebrickable_sync_service.db")
     def test_rebrickable_sync_service_imports(self, mock_db):
         """Test rebrickable sync service import coverage."""
-        try:
-            import services.rebrickable_sync_service as sync_service
 
-            # Test that module loaded
-            assert sync_service is not None
-
-            # Count available functions/classes
-            attr_count = 0
-            for attr_name in dir(sync_service):
-                if not attr_name.startswith("_"):
-                    attr_count += 1
-
-            assert attr_count > 0
-
-        except ImportError:
-            pass
+        # Test that it has some public functions/classes
+        assert any(not name.startswith("_") for name in vars(sync_service))
 
     @pytest.mark.unit
     def test_rebrickable_sets_sync_service_imports(self):
         """Test rebrickable sets sync service import coverage."""
-        try:
-            import services.rebrickable_sets_sync_service as sets_sync
-
-            # Test module loaded
-            assert sets_sync is not None
-
-            # Test that it has some content
-            module_content = dir(sets_sync)
-            non_private_attrs = [
-                attr for attr in module_content if not attr.startswith("_")
-            ]
-            assert len(non_private_attrs) > 0
-
-        except ImportError:
-            pass
-
-    @pytest.mark.unit
-    def test_token_service_comprehensive(self):
-        """Comprehensive token service testing."""
-        try:
-            from services.token_service import TokenException
-
-            # Test exception in various ways
-            exc1 = TokenException("Error 1")
-            exc2 = TokenException("")
-            exc3 = TokenException("Multi word error message")
-
-            assert str(exc1) == "Error 1"
-            assert str(exc2) == ""
-            assert str(exc3) == "Multi word error message"
-
-            # Test inheritance
-            assert isinstance(exc1, Exception)
-            assert isinstance(exc2, Exception)
-            assert isinstance(exc3, Exception)
 
-        except ImportError:
-            pass
+        # Test that it has some content
+        assert any(not name.startswith("_") for name in vars(sets_sync_service))
 
     @pytest.mark.unit
     def test_sqlite_service_comprehensive(self):
         """Comprehensive sqlite service testing."""
-        try:
-            import services.sqlite_service as sqlite_svc
 
-            # Test module exists and has content
-            assert sqlite_svc is not None
-
-            # Test it has callable functions
-            callable_count = 0
-            for attr_name in dir(sqlite_svc):
-                attr = getattr(sqlite_svc, attr_name)
-                if callable(attr) and not attr_name.startswith("_"):
-                    callable_count += 1
-
-            assert callable_count >= 0
-
-        except ImportError:
-            pass
+        # Test it has callable functions
+        assert _has_public_callable(sqlite_service)
 
     @pytest.mark.unit
     def test_brickognize_service_comprehensive(self):
         """Comprehensive brickognize service testing."""
-        try:
-            from services.brickognize_service import get_predictions
-
-            # Test function exists
-            assert callable(get_predictions)
-
-            # Test with mock data to exercise code paths
-            with patch("services.brickognize_service.requests.post") as mock_post:
-                with patch(
-                    "services.brickognize_service.get_category_name_from_part_num",
-                    return_value="Brick",
-                ) as mock_db:
-                    # Mock response
-                    mock_response = MagicMock()
-                    mock_response.status_code = 200
-                    mock_response.json.return_value = {"items": []}
-                    mock_post.return_value = mock_response
-
-                    # Mock file
-                    mock_file = MagicMock()
-                    mock_file.filename = "test.jpg"
-                    mock_file.read.return_value = b"fake_data"
-
-                    # Mock database queries
-                    mock_db.session.query.return_value.filter.return_value.first.return_value = (
-                        None
-                    )
-
-                    # Test prediction (may fail due to dependencies, but exercises import)
-                    try:
-                        get_predictions(mock_file, "test.jpg")
-                    except Exception:
-                        # Expected due to complex dependencies
-                        pass
-
-        except ImportError:
-            pass
+
+        # Test function exists
+        assert callable(get_predictions)
+
+        # Test with mock data to exercise code paths
+        with patch("services.brickognize_service.requests.post") as mock_post:
+            with patch(
+                "services.brickognize_service.get_category_names_for_part_nums",
+                return_value={},
+            ) as mock_db:
+                # Mock response
+                mock_response = MagicMock()
+                mock_response.status_code = 200
+                mock_response.json.return_value = {"items": []}
+                mock_post.return_value = mock_response
+
+                # Mock file
+                mock_file = MagicMock()
+                mock_file.filename = "test.jpg"
+                mock_file.read.return_value = b"fake_data"
+
+                # Mock database queries
+                mock_db.session.query.return_value.filter.return_value.first.return_value = (
+                    None
+                )
+
+                # Test prediction (may fail due to dependencies, but exercises import)
+                try:
+                    get_predictions(mock_file, "test.jpg")
+                except Exception:
+                    # Expected due to complex dependencies
+                    pass
 
     @pytest.mark.unit
     def test_label_service_comprehensive(self):
         """Comprehensive label service testing focusing on imports."""
-        try:
-            import services.label_service as label_svc
 
-            # Test module exists
-            assert label_svc is not None
-
-            # Test available functions
-            functions = []
-            for attr_name in dir(label_svc):
-                attr = getattr(label_svc, attr_name)
-                if callable(attr) and not attr_name.startswith("_"):
-                    functions.append(attr_name)
-
-            # Should have some functions
-            assert len(functions) >= 0
-
-        except ImportError:
-            pass
+        # Should have some functions
+        assert _has_public_callable(label_service)
 
     @pytest.mark.unit
-    def test_cache_service_comprehensive_coverage(self):
-        """Comprehensive cache service testing for maximum coverage."""
-
-        from services.cache_service import is_valid_url
-
-        # Test edge cases and various URL patterns
-        edge_cases = [
-            (
-                "https://very-long-subdomain.example-domain.com/path/to/resource.jpg",
-                True,
-            ),
-            ("http://192.168.1.1:8080/image.png", True),
-            ("https://cdn.example.org/nested/deep/path/file.jpg?param=value", True),
-            ("http://example.com/file.jpg#anchor", True),
-            ("https://api.rebrickable.com/api/v3/media/parts/elements/1234.jpg", True),
-            ("", False),
-            ("   ", False),
-            ("http", False),
-            ("://noscheme.com", False),
-            ("localhost:8080/file.jpg", False),
-            ("www.example.com/file.jpg", False),
-        ]
+    @pytest.mark.parametrize("url,expected", URL_CASES)
+    def test_cache_service_comprehensive_coverage(self, url, expected):
+        """Test cache service URL validation across edge cases."""
 
-        for url, expected in edge_cases:
-            result = is_valid_url(url.strip() if url else url)
-            assert result == expected, f"URL '{url}' should be {expected}"
+        assert is_valid_url(url.strip()) is expected
 
     @pytest.mark.unit
     def test_models_comprehensive_coverage(self):
@@ -356,106 +198,31 @@ class TestFinalCoveragePush:
                 assert callable(getattr(model, "to_dict"))
 
     @pytest.mark.unit
-    @patch("manage.app")
-    def test_manage_module_coverage(self, mock_app):
-        """Test manage module for coverage."""
-        try:
-            import manage
+    @pytest.mark.parametrize("attr,expected_type,expected_value", CONFIG_ATTRS)
+    def test_config_class_comprehensive(self, attr, expected_type, expected_value):
+        """Test each known config attribute has the expected type and value."""
 
-            # Test module exists
-            assert manage is not None
-
-            # Mock app context for potential execution
-            mock_app.app_context.return_value.__enter__ = MagicMock()
-            mock_app.app_context.return_value.__exit__ = MagicMock()
-
-        except ImportError:
-            pass
+        value = getattr(Config, attr)
+        assert isinstance(value, expected_type)
+        if expected_value is not None:
+            assert value == expected_value
 
     @pytest.mark.unit
-    def test_config_class_comprehensive(self):
-        """Comprehensive config class testing."""
-
-        from config import Config
-
-        # Test all known attributes
-        config_attrs = [
-            "UPLOAD_FOLDER",
-            "ALLOWED_EXTENSIONS",
-            "SQLALCHEMY_DATABASE_URI",
-            "SQLALCHEMY_TRACK_MODIFICATIONS",
-            "SECRET_KEY",
-        ]
-
-        for attr in config_attrs:
-            if hasattr(Config, attr):
-                value = getattr(Config, attr)
-                assert value is not None or value is False  # Allow False values
+    def test_config_value_contents(self):
+        """Test the contents of the path and extension settings."""
 
-        # Test specific value types
-        assert isinstance(Config.ALLOWED_EXTENSIONS, set)
-        assert len(Config.ALLOWED_EXTENSIONS) > 0
-        assert isinstance(Config.SQLALCHEMY_TRACK_MODIFICATIONS, bool)
+        assert {"png", "jpg"} <= Config.ALLOWED_EXTENSIONS
+        assert Config.UPLOAD_FOLDER.rstrip("/").endswith("uploads")
+        assert Config.SQLALCHEMY_DATABASE_URI.startswith("sqlite:")
 
     @pytest.mark.unit
-    def test_all_service_imports_coverage(self):
-        """Test importing all services for coverage boost."""
-
-        service_modules = [
-            "services.brickognize_service",
-            "services.cache_service",
-            "services.label_service",
-            "services.part_lookup_service",
-            "services.rebrickable_service",
-            "services.rebrickable_sets_sync_service",
-            "services.rebrickable_sync_service",
-            "services.sqlite_service",
-            "services.token_service",
-        ]
-
-        imported_count = 0
-        for module_name in service_modules:
-            try:
-                module = __import__(module_name, fromlist=[""])
-                assert module is not None
-                imported_count += 1
-            except ImportError:
-                # Expected for some modules
-                pass
+    def test_all_service_imports_coverage(self, service_module):
+        """Test importing every service module for coverage boost."""
 
-        # Should import at least some modules
-        assert imported_count >= 0
+        assert service_module is not None
 
     @pytest.mark.unit
-    def test_all_route_imports_coverage(self):
-        """Test importing all routes for coverage boost."""
-
-        route_modules = [
-            "routes.main",
-            "routes.dashboard",
-            "routes.set_search",
-            "routes.set_maintain",
-            "routes.part_lookup",
-            "routes.missing_parts",
-            "routes.upload",
-            "routes.storage",
-            "routes.import_rebrickable_data",
-            "routes.box_maintenance",
-            "routes.manual_entry",
-            "routes.part_location",
-            "routes.rebrickable_sync",
-            "routes.token_management",
-        ]
+    def test_all_route_imports_coverage(self, route_module):
+        """Test importing every route module for coverage boost."""
 
-        imported_count = 0
-        for module_name in route_modules:
-            try:
-                module = __import__(module_name, fromlist=[""])
-                assert module is not None
-                imported_count += 1
-            except ImportError:
-                # Expected for some modules in test environment
-                pass
-
-        # Should import at least some modules
-        assert imported_count >= 0
+        assert route_module is not None
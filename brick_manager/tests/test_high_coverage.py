@@ -5,36 +5,20 @@ High-impact tests to quickly boost coverage.
 Focus on easily testable components.
 """
 
-from unittest.mock import MagicMock, patch
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch, sentinel
 
 import pytest
-
-
-class TestConfigModule:
-    """Test configuration module - high coverage potential."""
-
-    @pytest.mark.unit
-    def test_config_class_exists(self):
-        """Test that Config class can be imported and has required attributes."""
-
-        from config import Config
-
-        # Test that the class exists
-        assert Config is not None
-
-        # Test that required attributes exist
-        assert hasattr(Config, "REBRICKABLE_TOKEN")
-        assert hasattr(Config, "SECRET_KEY")
-        assert hasattr(Config, "SQLALCHEMY_DATABASE_URI")
-
-    @pytest.mark.unit
-    def test_config_sqlalchemy_track_modifications(self):
-        """Test SQLAlchemy configuration."""
-
-        from config import Config
-
-        # This should be False for performance
-        assert Config.SQLALCHEMY_TRACK_MODIFICATIONS is False
+import routes.main as main_routes
+import services.cache_service as cache_service
+import services.part_lookup_service as part_lookup_service
+from services.brickognize_service import get_predictions
+from services.cache_service import cache_image, is_valid_url
+from services.label_service import save_image_as_pdf
+from services.part_lookup_service import load_part_lookup, save_part_lookup
+from services.rebrickable_service import RebrickableAPIException, RebrickableService
+from tests.helpers import StubResponse
 
 
 class TestMainRoutesModule:
@@ -43,45 +27,52 @@ class TestMainRoutesModule:
     @pytest.mark.unit
     def test_main_routes_import(self):
         """Test that main routes can be imported."""
-        try:
-            from routes import main
 
-            assert main is not None
-        except ImportError:
-            # If import fails, that's expected in test environment
-            pass
+        assert main_routes.main_bp is not None
 
 
 class TestServiceConstants:
     """Test service constants and class attributes."""
 
     @pytest.mark.unit
-    def test_rebrickable_service_constants(self):
-        """Test all RebrickableService constants."""
-
-        from services.rebrickable_service import RebrickableService
-
-        assert RebrickableService.BASE_URL == "https://rebrickable.com/api/v3/lego/"
-        assert RebrickableService.DEFAULT_TIMEOUT == 30
-        assert RebrickableService.MAX_RETRIES == 3
-        assert RebrickableService.INITIAL_RETRY_DELAY == 30
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("BASE_URL", "https://rebrickable.com/api/v3/lego/"),
+            ("DEFAULT_TIMEOUT", 30),
+            ("MAX_RETRIES", 3),
+            ("INITIAL_RETRY_DELAY", 30),
+        ],
+    )
+    def test_rebrickable_service_constants(self, attr, expected):
+        """Test each RebrickableService constant."""
+
+        assert getattr(RebrickableService, attr) == expected
 
     @pytest.mark.unit
     def test_rebrickable_exception_class(self):
         """Test RebrickableAPIException class."""
 
-        from services.rebrickable_service import RebrickableAPIException
+        with pytest.raises(RebrickableAPIException, match="^Test error$"):
+            raise RebrickableAPIException("Test error")
+
+        assert issubclass(RebrickableAPIException, Exception)
+
 
-        # Test exception creation
-        exc = RebrickableAPIException("Test error")
-        assert str(exc) == "Test error"
-        assert isinstance(exc, Exception)
+class _FakeQuery:
+    """Query stand-in returning fixed rows and no filtered match."""
 
-        # Test exception inheritance
-        try:
-            raise RebrickableAPIException("Test")
-        except Exception as e:
-            assert isinstance(e, RebrickableAPIException)
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+
+    def filter_by(self, **kwargs):
+        return self
+
+    def first(self):
+        return None
+
+    def all(self):
+        return self.rows
 
 
 class TestPartLookupServiceReal:
@@ -91,128 +82,102 @@ class TestPartLookupServiceReal:
     def test_part_lookup_service_import(self):
         """Test part lookup service can be imported."""
 
-        from services.part_lookup_service import load_part_lookup, save_part_lookup
-
         assert callable(load_part_lookup)
         assert callable(save_part_lookup)
 
     @pytest.mark.unit
-    @patch("services.part_lookup_service.PartStorage")
-    def test_load_part_lookup_function(self, mock_part_storage):
+    def test_load_part_lookup_function(self, monkeypatch):
         """Test load_part_lookup function."""
 
-        from services.part_lookup_service import load_part_lookup
+        # Start from an empty cache so the query is actually made
+        monkeypatch.setattr(part_lookup_service, "_part_lookup_cache", None)
 
-        # Mock database query
-        mock_query = MagicMock()
-        mock_query.all.return_value = []
-        mock_part_storage.query = mock_query
+        entry = SimpleNamespace(part_num="3001", location="A", level="1", box="B1")
+        monkeypatch.setattr(
+            part_lookup_service.PartStorage, "query", _FakeQuery([entry])
+        )
 
         result = load_part_lookup()
 
-        assert isinstance(result, dict)
-        mock_query.all.assert_called_once()
+        assert result == {"3001": {"location": "A", "level": "1", "box": "B1"}}
 
     @pytest.mark.unit
     @patch("services.part_lookup_service.db")
-    @patch("services.part_lookup_service.PartStorage")
-    def test_save_part_lookup_function(self, mock_part_storage, mock_db):
+    def test_save_part_lookup_function(self, mock_db, monkeypatch):
         """Test save_part_lookup function."""
 
-        from services.part_lookup_service import save_part_lookup
+        monkeypatch.setattr(part_lookup_service.PartStorage, "query", _FakeQuery())
 
         # Test with empty data (function returns None, not True)
         result = save_part_lookup({})
         assert result is None
 
-        # Test with actual data
+        # Test with actual data; no stored entry exists, so a new one is added
         test_data = {"3001": {"location": "A", "level": "1", "box": "B1"}}
 
-        # Mock the PartStorage constructor and database operations
-        mock_storage_instance = MagicMock()
-        mock_part_storage.return_value = mock_storage_instance
-        mock_part_storage.query.filter_by.return_value.first.return_value = None
-
         result = save_part_lookup(test_data)
 
-        # Should attempt to save
-        assert result is True
+        assert result is None
+        (new_entry,) = mock_db.session.add.call_args.args
+        assert (new_entry.part_num, new_entry.box) == ("3001", "B1")
+        assert mock_db.session.commit.call_count == 2
 
 
 class TestCacheServiceReal:
     """Test cache service with real function calls."""
 
     @pytest.mark.unit
-    def test_url_validation_comprehensive(self):
+    def test_url_validation_comprehensive(self, url_case):
         """Test URL validation function thoroughly."""
 
-        from services.cache_service import is_valid_url
-
-        # Test comprehensive set of URLs
-        test_cases = [
-            # Valid URLs
-            ("https://example.com", True),
-            ("http://test.com", True),
-            ("https://cdn.rebrickable.com/image.jpg", True),
-            ("http://localhost:8080/path", True),
-            ("ftp://files.com/file.txt", True),
-            # Invalid URLs
-            ("", False),
-            ("not-a-url", False),
-            ("http://", False),
-            ("https://", False),
-            ("://missing-scheme", False),
-            ("relative/path", False),
-        ]
-
-        for url, expected in test_cases:
-            result = is_valid_url(url)
-            assert result == expected, f"URL '{url}' should be {expected}"
+        url, expected = url_case
+        assert is_valid_url(url) is expected
 
     @pytest.mark.unit
-    @patch("services.cache_service.current_app")
-    @patch("services.cache_service.url_for")
-    def test_cache_image_with_none(self, mock_url_for, mock_app):
+    def test_cache_image_with_none(self, monkeypatch):
         """Test cache_image function with None input."""
 
-        from services.cache_service import cache_image
-
-        mock_url_for.return_value = "/static/default_image.png"
+        mock_url_for = MagicMock(return_value=sentinel.default_image)
+        monkeypatch.setattr(cache_service, "url_for", mock_url_for)
+        monkeypatch.setattr(
+            cache_service, "current_app", SimpleNamespace(logger=MagicMock())
+        )
 
         result = cache_image(None)
 
-        assert result == "/static/default_image.png"
-        mock_url_for.assert_called_once()
+        assert result is sentinel.default_image
+        mock_url_for.assert_called_once_with(
+            "static", filename="default_image.png", _external=True
+        )
 
     @pytest.mark.unit
-    @patch("services.cache_service.url_for")
-    @patch("services.cache_service.current_app")
-    def test_cache_image_with_invalid_url(self, mock_app, mock_url_for):
+    def test_cache_image_with_invalid_url(self, monkeypatch):
         """Test cache_image with invalid URL."""
 
-        from services.cache_service import cache_image
+        monkeypatch.setattr(
+            cache_service,
+            "url_for",
+            lambda *args, **kwargs: "/static/default_image.png",
+        )
+        mock_logger = MagicMock()
+        monkeypatch.setattr(
+            cache_service, "current_app", SimpleNamespace(logger=mock_logger)
+        )
+
+        # An invalid URL must be rejected before any disk or network access
+        def unexpected_io(*args, **kwargs):
+            raise AssertionError("cache_image touched I/O for an invalid URL")
 
-        mock_url_for.return_value = "/static/default_image.png"
+        monkeypatch.setattr(
+            cache_service, "requests", SimpleNamespace(get=unexpected_io)
+        )
+        monkeypatch.setattr(cache_service, "get_cache_directory", unexpected_io)
 
         result = cache_image("invalid-url")
 
         # Should return the fallback image when invalid
         assert result == "/static/default_image.png"
-
-
-class TestSQLiteService:
-    """Test SQLite service functions."""
-
-    @pytest.mark.unit
-    def test_sqlite_service_import(self):
-        """Test SQLite service can be imported."""
-        try:
-            from services.sqlite_service import get_database_info
-
-            assert callable(get_database_info)
-        except ImportError:
-            # Expected in some test environments
-            pass
+        mock_logger.warning.assert_called_once()
 
 
 class TestBrickognizeServiceIntegration:
@@ -223,28 +188,27 @@ class TestBrickognizeServiceIntegration:
     def test_brickognize_success_detailed(self, mock_post):
         """Test Brickognize service success scenario with details."""
 
-        from services.brickognize_service import get_predictions
-
         # Mock successful API response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "items": [
-                {"part_num": "3001", "confidence": 0.95, "part_name": "Brick 2 x 4"}
-            ]
-        }
-        mock_post.return_value = mock_response
-
-        # Create a mock file
-        mock_file = MagicMock()
-        mock_file.filename = "test.jpg"
-        mock_file.read.return_value = b"fake_image_data"
-
-        with patch(
-            "services.brickognize_service.get_category_name_from_part_num",
-            return_value="Brick",
+        mock_post.return_value = StubResponse(
+            200,
+            {
+                "items": [
+                    {"part_num": "3001", "confidence": 0.95, "part_name": "Brick 2 x 4"}
+                ]
+            },
+        )
+
+        # Serve the uploaded image from memory
+        image = io.BytesIO(b"fake_image_data")
+
+        with (
+            patch("services.brickognize_service.open", return_value=image, create=True),
+            patch(
+                "services.brickognize_service.get_category_names_for_part_nums",
+                return_value={},
+            ),
         ):
-            result = get_predictions(mock_file, "test.jpg")
+            result = get_predictions("test.jpg", "test.jpg")
 
             assert result is not None
             assert "items" in result
@@ -258,20 +222,17 @@ class TestLabelServiceIntegration:
     @pytest.mark.unit
     def test_label_service_import(self):
         """Test label service import."""
-        try:
-            from services.label_service import save_image_as_pdf
 
-            assert callable(save_image_as_pdf)
-        except ImportError:
-            pass
+        assert callable(save_image_as_pdf)
 
     @pytest.mark.unit
+    @patch("services.label_service.ImageReader")
     @patch("services.label_service.Image.open")
     @patch("services.label_service.canvas")
-    def test_save_image_as_pdf_error_handling(self, mock_canvas, mock_image_open):
-        """Test PDF generation error handling."""
-
-        from services.label_service import save_image_as_pdf
+    def test_save_image_as_pdf_error_handling(
+        self, mock_canvas, mock_image_open, mock_image_reader
+    ):
+        """Test PDF generation errors propagate to the caller."""
 
         # Mock Image.open to return a mock image
         mock_img = MagicMock()
@@ -281,105 +242,40 @@ class TestLabelServiceIntegration:
         # Mock canvas to raise an exception
         mock_canvas.Canvas.side_effect = Exception("PDF generation failed")
 
-        result = save_image_as_pdf("test.jpg", "output.pd")
-
-        # Should handle error gracefully
-        assert result is not None or result is None  # Depending on implementation
-
+        with pytest.raises(Exception, match="PDF generation failed"):
+            save_image_as_pdf("test.jpg", "output.pdf")
 
-class TestModelValidation:
-    """Test model validation functions."""
-
-    @pytest.mark.unit
-    def test_model_imports(self):
-        """Test that all models can be imported."""
-
-        from models import (
-            PartStorage,
-            RebrickableColors,
-            RebrickablePartCategories,
-            RebrickableParts,
-            RebrickableSets,
-            User_Parts,
-            User_Set,
-            UserMinifigurePart,
-            db,
-        )
-
-        # Verify all models exist
-        assert User_Set is not None
-        assert User_Parts is not None
-        assert UserMinifigurePart is not None
-        assert PartStorage is not None
-        assert RebrickablePartCategories is not None
-        assert RebrickableColors is not None
-        assert RebrickableParts is not None
-        assert RebrickableSets is not None
-        assert db is not None
-
-
-class TestApplicationStructure:
-    """Test application structure and imports."""
-
-    @pytest.mark.unit
-    def test_app_module_structure(self):
-        """Test app module can be imported."""
-        try:
-            from app import create_app
-
-            assert callable(create_app)
-        except ImportError:
-            # Expected in some environments
-            pass
-
-    @pytest.mark.unit
-    def test_route_modules_exist(self):
-        """Test that route modules exist."""
-        try:
-            import routes
-
-            assert routes is not None
-        except ImportError:
-            pass
+        mock_image_open.assert_called_once_with("test.jpg")
+        mock_canvas.Canvas.assert_called_once_with("output.pdf", pagesize=(100, 100))
+        mock_image_reader.assert_not_called()
 
 
 class TestDatabaseFunctions:
     """Test database-related utility functions."""
 
-    @pytest.mark.unit
-    def test_database_model_representations(self):
-        """Test model __repr__ methods exist."""
-
-        from models import (
-            PartStorage,
-            RebrickableColors,
-            RebrickablePartCategories,
-            RebrickableParts,
-            RebrickableSets,
-        )
-
-        # Test that __repr__ methods exist
-        assert hasattr(RebrickablePartCategories, "__repr__")
-        assert hasattr(RebrickableColors, "__repr__")
-        assert hasattr(RebrickableParts, "__repr__")
-        assert hasattr(RebrickableSets, "__repr__")
-        assert hasattr(PartStorage, "__repr__")
+    TO_DICT_MODELS = (
+        "RebrickablePartCategories",
+        "RebrickableColors",
+        "RebrickableParts",
+        "RebrickableSets",
+        "User_Set",
+    )
+    REPR_MODELS = (
+        "RebrickablePartCategories",
+        "RebrickableColors",
+        "RebrickableParts",
+        "RebrickableSets",
+        "PartStorage",
+        "User_Set",
+    )
 
     @pytest.mark.unit
-    def test_database_model_to_dict_methods(self):
-        """Test model to_dict methods exist."""
-
-        from models import (
-            RebrickableColors,
-            RebrickablePartCategories,
-            RebrickableParts,
-            RebrickableSets,
-            User_Set,
-        )
-
-        # Test that to_dict methods exist where expected
-        assert hasattr(RebrickablePartCategories, "to_dict")
-        assert hasattr(RebrickableColors, "to_dict")
-        assert hasattr(RebrickableParts, "to_dict")
-        assert hasattr(RebrickableSets, "to_dict")
-        assert hasattr(User_Set, "to_dict")
+    @pytest.mark.parametrize(
+        "model,method",
+        [(model, "to_dict") for model in TO_DICT_MODELS]
+        + [(model, "__repr__") for model in REPR_MODELS],
+    )
+    def test_model_has_method(self, all_models, model, method):
+        """Test the models define their to_dict and __repr__ methods."""
+
+        assert callable(getattr(all_models[model], method))
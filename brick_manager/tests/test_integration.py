@@ -127,21 +127,22 @@ class TestApplicationIntegration:
         response = client.get("/missing_parts_category/Brick")
         assert response.status_code in [200, 404]
 
-    def test_navigation_between_pages(self, client):
-        """Test navigation between different pages."""
-
-        pages = [
+    @pytest.mark.parametrize(
+        "page",
+        [
             "/",
             "/set_search",
             "/lookup_part",
             "/missing_parts",
             "/dashboard",
             "/set_maintain",
-        ]
+        ],
+    )
+    def test_navigation_between_pages(self, client, page):
+        """Test each main page loads."""
 
-        for page in pages:
-            response = client.get(page)
-            assert response.status_code == 200
+        response = client.get(page)
+        assert response.status_code == 200
 
     @patch("services.cache_service.requests.get")
     def test_image_caching_integration(self, mock_get):
@@ -67,7 +67,9 @@ class TestMaxCoverageBoost:
 
     @patch("brick_manager.app.shutil.copyfile")
     @patch("brick_manager.app.datetime")
-    def test_app_backup_and_scheduler_functions(self, mock_datetime, mock_copyfile):
+    def test_app_backup_and_scheduler_functions(
+        self, mock_datetime, mock_copyfile, sqlite_file_uri
+    ):
         """Test app backup and scheduler functions."""
 
         from brick_manager.app import app, backup_database
@@ -76,7 +78,8 @@ class TestMaxCoverageBoost:
 
         with app.app_context():
             # Test backup function
-            backup_database()
+            with patch.dict(app.config, {"SQLALCHEMY_DATABASE_URI": sqlite_file_uri}):
+                backup_database()
             assert mock_copyfile.called
 
             # Test scheduled function imports
@@ -419,3 +419,29 @@ class TestModelRelationships:
             assert len(inventory.parts) == 2
             assert inv_part1 in inventory.parts
             assert inv_part2 in inventory.parts
+
+
+class TestDatabaseTuning:
+    """Test cases for the SQLite connection tuning and indexes."""
+
+    def test_pragmas_applied_on_connect(self, app):
+        """Test new connections pick up the configured PRAGMAs."""
+        with app.app_context():
+            connection = db.session.connection()
+
+            assert connection.exec_driver_sql("PRAGMA temp_store").scalar() == 2
+            assert connection.exec_driver_sql("PRAGMA cache_size").scalar() == -65536
+
+    def test_rebrickable_parts_category_index(self, app):
+        """Test the category listing index exists on rebrickable_parts."""
+        with app.app_context():
+            inspector = db.inspect(db.session.connection())
+            indexes = {
+                index["name"]: index["column_names"]
+                for index in inspector.get_indexes("rebrickable_parts")
+            }
+
+            assert indexes["idx_rebrickable_parts_category"] == [
+                "part_cat_id",
+                "part_num",
+            ]
@@ -385,6 +385,31 @@ class TestRebrickableSyncServiceCoverage:
         sync_missing_parts_with_rebrickable()
         # Should return early without token
 
+    @patch("brick_manager.services.rebrickable_sync_service.update_rate_limit_tracker")
+    @patch(
+        "brick_manager.services.rebrickable_sync_service.should_skip_api_calls",
+        return_value=False,
+    )
+    @patch("brick_manager.services.rebrickable_sync_service.requests.post")
+    def test_add_parts_individually_stops_after_consecutive_429(
+        self, mock_post, mock_skip, mock_tracker
+    ):
+        """Test individual adds stop after repeated rate limiting."""
+
+        mock_post.return_value = Mock(status_code=429)
+        parts = [
+            {"part_num": f"300{i}", "color_id": 1, "quantity": 1} for i in range(8)
+        ]
+
+        from brick_manager.services.rebrickable_sync_service import (
+            add_parts_individually_to_list,
+        )
+
+        result = add_parts_individually_to_list(1, parts, {}, "test_token")
+
+        assert mock_post.call_count == 5
+        assert result == {"added_count": 0, "rate_limited_count": 8}
+
 
 class TestRebrickableSetsServiceCoverage:
     """Test rebrickable_sets_sync_service for coverage boost."""
@@ -0,0 +1,102 @@
+"""
+
+Unit tests for the sqlite_service module.
+
+
+This test suite validates the category name lookups against the local
+Rebrickable reference tables.
+"""
+
+import pytest
+import services.sqlite_service as sqlite_service
+from models import RebrickablePartCategories, RebrickableParts, db
+from services.sqlite_service import (
+    clear_category_caches,
+    get_category_name_from_db,
+    get_category_name_from_part_num,
+    get_category_names_for_part_nums,
+    get_readonly_session,
+)
+
+
+def _add_part(part_num="3001", part_cat_id=11, category_name="Bricks"):
+    """Store a part and its category in the reference tables."""
+    db.session.add(RebrickablePartCategories(id=part_cat_id, name=category_name))
+    db.session.add(
+        RebrickableParts(part_num=part_num, name="Brick 2 x 4", part_cat_id=part_cat_id)
+    )
+    db.session.commit()
+
+
+class TestCategoryLookups:
+    """Test cases for the category name lookups."""
+
+    def test_category_name_from_db(self, app):
+        """Test looking up a category by ID."""
+        with app.app_context():
+            _add_part()
+
+            assert get_category_name_from_db(11) == "Bricks"
+            assert get_category_name_from_db(999) == "Unknown Category"
+
+    def test_category_name_from_part_num(self, app):
+        """Test looking up a category by part number."""
+        with app.app_context():
+            _add_part()
+
+            assert get_category_name_from_part_num("3001") == "Bricks"
+            assert get_category_name_from_part_num("missing") == "Unknown Category"
+
+    def test_lookups_are_cached_until_cleared(self, app):
+        """Test cached names are served until the caches are cleared."""
+        with app.app_context():
+            _add_part()
+            assert get_category_name_from_db(11) == "Bricks"
+            assert get_category_name_from_part_num("3001") == "Bricks"
+
+            db.session.get(RebrickablePartCategories, 11).name = "Plates"
+            db.session.commit()
+
+            assert get_category_name_from_db(11) == "Bricks"
+            assert get_category_name_from_part_num("3001") == "Bricks"
+
+            clear_category_caches()
+
+            assert get_category_name_from_db(11) == "Plates"
+            assert get_category_name_from_part_num("3001") == "Plates"
+
+    def test_category_names_for_part_nums(self, app, monkeypatch):
+        """Test the batch lookup across several IN clause chunks."""
+        monkeypatch.setattr(sqlite_service, "SQLITE_IN_CHUNK_SIZE", 2)
+        with app.app_context():
+            _add_part()
+            _add_part(part_num="3020", part_cat_id=14, category_name="Plates")
+            db.session.add(
+                RebrickableParts(part_num="3022", name="Plate 2 x 2", part_cat_id=99)
+            )
+            db.session.commit()
+
+            result = get_category_names_for_part_nums(
+                ["3001", "3020", "3022", "missing", "3001"]
+            )
+
+            assert result == {
+                "3001": "Bricks",
+                "3020": "Plates",
+                "3022": "Unknown Category",
+                "missing": "Unknown Category",
+            }
+
+
+class TestReadonlySession:
+    """Test cases for get_readonly_session."""
+
+    def test_readonly_session_sees_committed_rows(self, app):
+        """Test the read-only session reads data committed by db.session."""
+        with app.app_context():
+            _add_part()
+
+            with get_readonly_session() as session:
+                category = session.get(RebrickablePartCategories, 11)
+
+                assert category.name == "Bricks"
@@ -0,0 +1,186 @@
+"""
+
+Unit tests for the token_service module.
+
+
+This test suite validates how stored Rebrickable credentials are loaded
+and turned into request headers.
+"""
+
+import base64
+
+import pytest
+from cryptography.fernet import Fernet
+from models import ConfigSettings, db
+from routes.token_management import get_encryption_key as create_encryption_key
+from services.token_service import (
+    get_encryption_key,
+    get_rebrickable_api_key,
+    get_rebrickable_headers,
+    get_rebrickable_user_token,
+    invalidate_api_key_cache,
+    invalidate_encryption_key_cache,
+    invalidate_token_cache,
+    is_user_token_configured,
+)
+
+
+def _store_credentials(api_key="test_api_key", user_token=None):
+    """Store Rebrickable credentials the way the token management page does."""
+    key = Fernet.generate_key()
+    settings = [
+        ConfigSettings(key="encryption_key", value=base64.b64encode(key).decode()),
+        ConfigSettings(key="rebrickable_api_key", value=api_key),
+    ]
+    if user_token:
+        settings.append(
+            ConfigSettings(
+                key="rebrickable_user_token",
+                value=Fernet(key).encrypt(user_token.encode()).decode(),
+                encrypted=True,
+            )
+        )
+    db.session.add_all(settings)
+    db.session.commit()
+
+
+class TestGetRebrickableHeaders:
+    """Test cases for get_rebrickable_headers."""
+
+    def test_headers_with_user_token(self, app):
+        """Test headers include the decrypted user token."""
+        with app.app_context():
+            _store_credentials(user_token="secret_user_token")
+
+            headers = get_rebrickable_headers()
+
+            assert headers == {
+                "Accept": "application/json",
+                "Authorization": "key test_api_key",
+                "User-Token": "secret_user_token",
+            }
+
+    def test_headers_without_user_token(self, app):
+        """Test headers are built from the API key alone."""
+        with app.app_context():
+            _store_credentials()
+
+            headers = get_rebrickable_headers()
+
+            assert headers == {
+                "Accept": "application/json",
+                "Authorization": "key test_api_key",
+            }
+
+    def test_headers_are_reused_within_a_request(self, app):
+        """Test headers are only built once per request."""
+        with app.test_request_context():
+            _store_credentials()
+            headers = get_rebrickable_headers()
+
+            ConfigSettings.query.filter_by(key="rebrickable_api_key").delete()
+            db.session.commit()
+
+            assert get_rebrickable_headers() == headers
+
+        invalidate_api_key_cache()
+        with app.test_request_context():
+            assert get_rebrickable_headers() is None
+
+    def test_headers_use_cached_credentials(self, app):
+        """Test later requests build headers from the cached credentials."""
+        with app.test_request_context():
+            _store_credentials(user_token="secret_user_token")
+            headers = get_rebrickable_headers()
+
+            ConfigSettings.query.delete()
+            db.session.commit()
+
+        with app.test_request_context():
+            assert get_rebrickable_headers() == headers
+
+    def test_headers_without_api_key(self, app):
+        """Test no headers are returned when the API key is missing."""
+        with app.app_context():
+            assert get_rebrickable_headers() is None
+
+
+class TestStoredCredentials:
+    """Test cases for the individual credential accessors."""
+
+    def test_credentials_are_read_and_decrypted(self, app):
+        """Test the stored API key and user token are returned."""
+        with app.app_context():
+            _store_credentials(user_token="secret_user_token")
+
+            assert get_rebrickable_api_key() == "test_api_key"
+            assert get_rebrickable_user_token() == "secret_user_token"
+            assert is_user_token_configured() is True
+
+    def test_missing_user_token(self, app):
+        """Test accessors when no user token is stored."""
+        with app.app_context():
+            _store_credentials()
+
+            assert get_rebrickable_user_token() is None
+            assert is_user_token_configured() is False
+
+    def test_user_token_is_cached_until_invalidated(self, app):
+        """Test the decrypted user token is reused until the cache is invalidated."""
+        with app.app_context():
+            _store_credentials(user_token="secret_user_token")
+            assert get_rebrickable_user_token() == "secret_user_token"
+
+            ConfigSettings.query.filter_by(key="rebrickable_user_token").delete()
+            db.session.commit()
+
+            assert get_rebrickable_user_token() == "secret_user_token"
+
+            invalidate_token_cache()
+
+            assert get_rebrickable_user_token() is None
+
+    def test_api_key_is_cached_until_invalidated(self, app):
+        """Test the API key is reused until the cache is invalidated."""
+        with app.app_context():
+            _store_credentials()
+            assert get_rebrickable_api_key() == "test_api_key"
+
+            ConfigSettings.query.filter_by(key="rebrickable_api_key").update(
+                {"value": "new_api_key"}
+            )
+            db.session.commit()
+
+            assert get_rebrickable_api_key() == "test_api_key"
+
+            invalidate_api_key_cache()
+
+            assert get_rebrickable_api_key() == "new_api_key"
+
+    def test_encryption_key_is_loaded_once(self, app):
+        """Test the encryption key is kept after the first database read."""
+        with app.app_context():
+            _store_credentials(user_token="secret_user_token")
+            key = get_encryption_key()
+
+            ConfigSettings.query.filter_by(key="encryption_key").delete()
+            db.session.commit()
+
+            assert get_encryption_key() == key
+
+            invalidate_encryption_key_cache()
+
+            assert get_encryption_key() is None
+
+    def test_new_encryption_key_replaces_cached_key(self, app):
+        """Test a key created by token management is picked up right away."""
+        with app.app_context():
+            _store_credentials(user_token="secret_user_token")
+            old_key = get_encryption_key()
+
+            ConfigSettings.query.filter_by(key="encryption_key").delete()
+            db.session.commit()
+            new_key = create_encryption_key()
+
+            assert new_key != old_key
+            assert get_encryption_key() == new_key
@@ -0,0 +1,13 @@
+"""Repository-level pytest configuration, loaded once before any test module."""
+
+import os
+import pathlib
+import sys
+
+# Make the application modules importable as top-level packages (models, services, ...)
+sys.path.insert(0, str(pathlib.Path(__file__).parent / "brick_manager"))
+
+# Keep the production app off the on-disk database; config.py reads this at import
+os.environ["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+# Register the scheduled jobs without starting the background scheduler thread
+os.environ.setdefault("BRICK_MANAGER_DISABLE_SCHEDULER", "1")